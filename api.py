@@ -1,19 +1,109 @@
+import asyncio
+import hmac
+import json
 import logging
-import os
-from typing import Optional
-from fastapi import FastAPI, Request, Depends, HTTPException, status, Header
+from collections import defaultdict
+from typing import Optional, Any, AsyncContextManager, Awaitable, Callable, Dict, Hashable
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, FastAPI, Request, Depends, HTTPException, status, Header
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
+from starlette.background import BackgroundTask
+from settings import get_settings
 from sonarr import Sonarr
 
-# Initialize FastAPI app
-app = FastAPI(
-    title="Sonarr Webhook API",
-    description="API for handling Sonarr webhooks and retrieving series information",
-    version="1.0.0"
-)
+# Configuration is read once at import rather than on every request
+settings = get_settings()
+WEBHOOK_API_KEY_BYTES = settings.webhook_api_key.encode() if settings.webhook_api_key else b''
 
-async def verify_api_key(x_api_key: str = Header(None)) -> bool:
+# Routes are declared once at import and bound to an app in initialize_api
+router = APIRouter()
+series_router = APIRouter(prefix="/series")
+
+# Short-lived caches of serialized responses for read-heavy endpoints
+SERIES_CACHE_TTL = 60
+SERIES_BY_ID_CACHE_TTL = 300
+CALENDAR_CACHE_TTL = 30
+
+series_cache: TTLCache = TTLCache(maxsize=1, ttl=SERIES_CACHE_TTL)
+series_by_id_cache: TTLCache = TTLCache(maxsize=512, ttl=SERIES_BY_ID_CACHE_TTL)  # LRU-evicted, keyed by series ID
+calendar_cache: TTLCache = TTLCache(maxsize=64, ttl=CALENDAR_CACHE_TTL)
+_cache_locks: Dict[Hashable, asyncio.Lock] = defaultdict(asyncio.Lock)  # key -> lock for a fetch in progress
+
+# Static health response, built once at import
+HEALTHY_RESPONSE = PlainTextResponse("ok")
+
+# Webhook events that change the series list and must invalidate cached series
+SERIES_INVALIDATING_EVENTS = {"SeriesAdd", "SeriesDelete", "Rename"}
+
+async def get_cached(cache: TTLCache, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
     """
-    Verify API key from header
+    Return a cached value or fetch and store it
+    
+    Concurrent misses for the same key share a lock so only one request hits Sonarr.
+    
+    Args:
+        cache (TTLCache): Cache to read from and populate
+        key (Hashable): Cache key
+        fetch (Callable[[], Awaitable[Any]]): Coroutine factory producing the value on a miss
+        
+    Returns:
+        Any: Cached or freshly fetched value
+    """
+    if key in cache:
+        return cache[key]
+    
+    lock = _cache_locks[key]
+    try:
+        async with lock:
+            if key in cache:
+                return cache[key]
+            value = await fetch()
+            cache[key] = value
+            return value
+    finally:
+        # Locks are only needed while a fetch is pending; drop them so keys taken from
+        # request input don't accumulate. Callers still queued on this lock find the cache filled.
+        if _cache_locks.get(key) is lock:
+            del _cache_locks[key]
+
+def dump_json(content: Any) -> bytes:
+    """Serialize a Sonarr payload straight to JSON bytes"""
+    return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+async def fetch_json(fetch: Callable[[], Awaitable[Any]]) -> bytes:
+    """Await a Sonarr call and return its result serialized as JSON bytes"""
+    return dump_json(await fetch())
+
+def json_response(body: bytes) -> Response:
+    """Wrap pre-serialized JSON bytes in a response without re-encoding"""
+    return Response(content=body, media_type="application/json")
+
+async def get_series_json(sonarr_client: Sonarr, series_id: int) -> bytes:
+    """
+    Get a serialized series by ID, cached under the integer series ID
+    
+    Args:
+        sonarr_client (Sonarr): Initialized Sonarr client instance
+        series_id (int): Sonarr series ID
+        
+    Returns:
+        bytes: Series JSON
+    """
+    return await get_cached(
+        series_by_id_cache,
+        series_id,
+        lambda: fetch_json(lambda: sonarr_client.get_series_by_id(series_id))
+    )
+
+def invalidate_series_caches() -> None:
+    """Drop all cached series responses"""
+    series_cache.clear()
+    series_by_id_cache.clear()
+
+async def check_api_key(x_api_key: str = Header(None)) -> bool:
+    """
+    Verify API key from header against the configured WEBHOOK_API_KEY
     
     Args:
         x_api_key (str): API key from X-API-Key header
@@ -24,12 +114,6 @@ async def verify_api_key(x_api_key: str = Header(None)) -> bool:
     Raises:
         HTTPException: If API key is invalid or missing
     """
-    correct_api_key = os.getenv('WEBHOOK_API_KEY')
-    
-    # If API key is not configured, allow access
-    if not correct_api_key:
-        return True
-    
     if not x_api_key:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -37,7 +121,7 @@ async def verify_api_key(x_api_key: str = Header(None)) -> bool:
             headers={"WWW-Authenticate": "ApiKey"},
         )
     
-    if x_api_key != correct_api_key:
+    if not hmac.compare_digest(x_api_key.encode(), WEBHOOK_API_KEY_BYTES):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid API key",
@@ -46,103 +130,178 @@ async def verify_api_key(x_api_key: str = Header(None)) -> bool:
     
     return True
 
-def initialize_api(sonarr_client: Sonarr) -> FastAPI:
+async def allow_without_api_key() -> bool:
+    """Dependency used when no API key is configured - always allows access"""
+    return True
+
+# Resolve the auth dependency once; without a configured key no header is parsed
+verify_api_key = check_api_key if settings.webhook_api_key else allow_without_api_key
+
+def get_sonarr(request: Request) -> Sonarr:
+    """Provide the Sonarr client attached to the application state"""
+    return request.app.state.sonarr
+
+async def process_webhook(sonarr_client: Sonarr, event_data: dict) -> None:
     """
-    Initialize the FastAPI application with routes
+    Handle a webhook event after its response has been sent
     
     Args:
         sonarr_client (Sonarr): Initialized Sonarr client instance
+        event_data (dict): Parsed webhook payload
+    """
+    try:
+        await sonarr_client.handle_webhook(event_data)
+        if event_data.get('eventType') in SERIES_INVALIDATING_EVENTS:
+            invalidate_series_caches()
+    except Exception:
+        logging.exception("Error processing webhook")
+
+async def handle_bad_request(request: Request, exc: ValueError) -> ORJSONResponse:
+    """
+    Turn errors decoding client input into a JSON 400 response
+    
+    Args:
+        request (Request): Request that failed
+        exc (ValueError): JSON or text decoding error raised while reading the request
         
     Returns:
-        FastAPI: Configured FastAPI application
+        ORJSONResponse: 400 response with the error message
+    """
+    logging.warning("Bad request to %s %s: %s", request.method, request.url.path, exc)
+    return ORJSONResponse(
+        {"status": "error", "message": str(exc)},
+        status_code=status.HTTP_400_BAD_REQUEST
+    )
+
+async def handle_unexpected_error(request: Request, exc: Exception) -> ORJSONResponse:
     """
+    Turn unhandled route errors into a JSON error response
     
-    @app.post("/webhook")
-    async def webhook(request: Request, authenticated: bool = Depends(verify_api_key)):
-        """
-        Webhook endpoint for Sonarr events
-        
-        Requires API key in X-API-Key header if WEBHOOK_API_KEY is set
-        """
-        try:
-            event_data = await request.json()
-            sonarr_client.handle_webhook(event_data)
-            return {"status": "success"}
-        except Exception as e:
-            logging.error(f"Error processing webhook: {str(e)}")
-            return {"status": "error", "message": str(e)}
-
-    @app.get("/health")
-    async def health_check():
-        """
-        Health check endpoint
-        """
-        return {"status": "healthy"}
-    
-    @app.get("/calendar")
-    async def get_calendar(
-        past_days: int = 7, 
-        future_days: int = 7,
-        authenticated: bool = Depends(verify_api_key)
-    ):
-        """
-        Get calendar entries for a date range
-        
-        Args:
-            past_days (int): Number of days to look back (default: 7)
-            future_days (int): Number of days to look ahead (default: 7)
-            
-        Requires API key in X-API-Key header if WEBHOOK_API_KEY is set
-        """
-        try:
-            return sonarr_client.get_episodes_calendar(past_days, future_days)
-        except Exception as e:
-            logging.error(f"Error retrieving calendar: {str(e)}")
-            return {"status": "error", "message": str(e)}
-    
-    @app.get("/series")
-    async def get_series(authenticated: bool = Depends(verify_api_key)):
-        """
-        Get all series from Sonarr
+    Client decode errors are answered by handle_bad_request first; anything else is a server fault.
+    
+    Args:
+        request (Request): Request that failed
+        exc (Exception): Unhandled exception
         
-        Requires API key in X-API-Key header if WEBHOOK_API_KEY is set
-        """
-        try:
-            series = sonarr_client.get_series()
-            return series
-        except Exception as e:
-            logging.error(f"Error retrieving series: {str(e)}")
-            return {"status": "error", "message": str(e)}
-    
-    @app.get("/series/{series_id}")
-    async def get_series_by_id(series_id: int, authenticated: bool = Depends(verify_api_key)):
-        """
-        Get a specific series by ID
+    Returns:
+        ORJSONResponse: 500 response with the error message
+    """
+    logging.exception("Error handling %s %s", request.method, request.url.path)
+    return ORJSONResponse(
+        {"status": "error", "message": str(exc)},
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+    )
+
+@router.post("/webhook")
+async def webhook(request: Request, sonarr_client: Sonarr = Depends(get_sonarr), authenticated: bool = Depends(verify_api_key)):
+    """
+    Webhook endpoint for Sonarr events
+    
+    Responds with 202 immediately; the event is processed in a background task.
+    
+    Requires API key in X-API-Key header if WEBHOOK_API_KEY is set
+    """
+    try:
+        event_data = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        # A 4xx stops Sonarr redelivering a payload that can never parse
+        raise HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid JSON body")
+    return ORJSONResponse(
+        {"status": "accepted"},
+        status_code=status.HTTP_202_ACCEPTED,
+        background=BackgroundTask(process_webhook, sonarr_client, event_data)
+    )
+
+async def health_check(request: Request) -> PlainTextResponse:
+    """
+    Health check endpoint
+    
+    Registered as a plain Starlette route so it skips FastAPI's dependency and
+    response-model handling.
+    """
+    return HEALTHY_RESPONSE
+
+@router.get("/calendar", response_model=None)
+async def get_calendar(
+    past_days: int = 7, 
+    future_days: int = 7,
+    sonarr_client: Sonarr = Depends(get_sonarr),
+    authenticated: bool = Depends(verify_api_key)
+):
+    """
+    Get calendar entries for a date range
+    
+    Args:
+        past_days (int): Number of days to look back (default: 7)
+        future_days (int): Number of days to look ahead (default: 7)
         
-        Requires API key in X-API-Key header if WEBHOOK_API_KEY is set
-        """
-        try:
-            series = sonarr_client.get_series_by_id(series_id)
-            return series
-        except Exception as e:
-            logging.error(f"Error retrieving series: {str(e)}")
-            return {"status": "error", "message": str(e)}
-    
-    @app.get("/series/{series_id}/episodes")
-    async def get_episodes(series_id: int, season_number: int = None, authenticated: bool = Depends(verify_api_key)):
-        """
-        Get episodes for a series, optionally filtered by season
+    Requires API key in X-API-Key header if WEBHOOK_API_KEY is set
+    """
+    calendar = await get_cached(
+        calendar_cache,
+        ('calendar', past_days, future_days),
+        lambda: fetch_json(lambda: sonarr_client.get_episodes_calendar(past_days, future_days))
+    )
+    return json_response(calendar)
+
+@series_router.get("", response_model=None)
+async def get_series(sonarr_client: Sonarr = Depends(get_sonarr), authenticated: bool = Depends(verify_api_key)):
+    """
+    Get all series from Sonarr
+    
+    Requires API key in X-API-Key header if WEBHOOK_API_KEY is set
+    """
+    series = await get_cached(series_cache, 'series', lambda: fetch_json(sonarr_client.get_series))
+    return json_response(series)
+
+@series_router.get("/{series_id}", response_model=None)
+async def get_series_by_id(series_id: int, sonarr_client: Sonarr = Depends(get_sonarr), authenticated: bool = Depends(verify_api_key)):
+    """
+    Get a specific series by ID
+    
+    Requires API key in X-API-Key header if WEBHOOK_API_KEY is set
+    """
+    return json_response(await get_series_json(sonarr_client, series_id))
+
+@series_router.get("/{series_id}/episodes", response_model=None)
+async def get_episodes(series_id: int, season_number: int = None, sonarr_client: Sonarr = Depends(get_sonarr), authenticated: bool = Depends(verify_api_key)):
+    """
+    Get episodes for a series, optionally filtered by season
+    
+    Requires API key in X-API-Key header if WEBHOOK_API_KEY is set
+    """
+    if season_number is not None:
+        episodes = await sonarr_client.get_season_by_series_id(series_id, season_number)
+    else:
+        episodes = await sonarr_client.get_episodes_by_series_id(series_id)
+    return json_response(dump_json(episodes))
+
+def initialize_api(sonarr_client: Sonarr, lifespan: Optional[Callable[[FastAPI], AsyncContextManager[None]]] = None) -> FastAPI:
+    """
+    Initialize the FastAPI application with routes
+    
+    Args:
+        sonarr_client (Sonarr): Initialized Sonarr client instance
+        lifespan (Optional[Callable]): Lifespan context manager for startup/shutdown work
         
-        Requires API key in X-API-Key header if WEBHOOK_API_KEY is set
-        """
-        try:
-            if season_number is not None:
-                episodes = sonarr_client.get_season_by_series_id(series_id, season_number)
-            else:
-                episodes = sonarr_client.get_episodes_by_series_id(series_id)
-            return episodes
-        except Exception as e:
-            logging.error(f"Error retrieving episodes: {str(e)}")
-            return {"status": "error", "message": str(e)}
+    Returns:
+        FastAPI: Configured FastAPI application
+    """
+    app = FastAPI(
+        title="Sonarr Webhook API",
+        description="API for handling Sonarr webhooks and retrieving series information",
+        version="1.0.0",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
+    )
+    app.state.settings = settings
+    app.state.sonarr = sonarr_client
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so both decoders map to 400
+    app.add_exception_handler(json.JSONDecodeError, handle_bad_request)
+    app.add_exception_handler(UnicodeDecodeError, handle_bad_request)
+    app.add_exception_handler(Exception, handle_unexpected_error)
+    app.add_route("/health", health_check, methods=["GET"], include_in_schema=False)
+    app.include_router(router)
+    app.include_router(series_router)
     
     return app
@@ -0,0 +1,31 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that reuses the formatted timestamp for records logged in the same second"""
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        self._local = threading.local()
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record time, calling strftime at most once per second per thread"""
+        datefmt = datefmt or self.datefmt
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cache = self._local
+        if getattr(cache, 'second', None) != second:
+            cache.second = second
+            cache.text = time.strftime(self.default_time_format, self.converter(record.created))
+        return self.default_msec_format % (cache.text, record.msecs)
+
+
+# Single formatter instance shared by every handler in the application
+LOG_FORMATTER = CachedTimeFormatter(LOG_FORMAT)
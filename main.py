@@ -1,44 +1,76 @@
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import os
-from dotenv import load_dotenv
+import queue
+from contextlib import asynccontextmanager
+import aiohttp
 from fastapi import FastAPI, Request, HTTPException, Depends
 from api import initialize_api
+from log_formatter import LOG_FORMATTER
 from notion_db import NotionDB, NotionPropertyType
 from sonarr import Sonarr
 from youtube_api import YouTubeAPI
 from scheduled_tasks import ScheduledTasks
+from settings import get_settings
 
-# Load environment variables
-load_dotenv()
+# Load configuration once
+settings = get_settings()
 
-# Configure logging
-log_dir = "logs"
-if not os.path.exists(log_dir):
-    os.makedirs(log_dir)
+def configure_logging() -> QueueListener:
+    """Route root logging through a queue listener, reusing the existing one if already configured
+    
+    Safe to call more than once per process (e.g. if this module is imported both as
+    __main__ and as main), so handlers and listener threads are never duplicated.
+    """
+    logger = logging.getLogger()
+    for handler in logger.handlers:
+        listener = getattr(handler, 'app_listener', None)
+        if listener is not None:
+            return listener
+
+    log_dir = "logs"
+    if not os.path.exists(log_dir):
+        os.makedirs(log_dir)
+
+    logger.setLevel(logging.DEBUG)
+
+    # Create console handler with INFO level
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(settings.log_level)
+    console_handler.setFormatter(LOG_FORMATTER)
+
+    # Create file handler with DEBUG level and rotation
+    file_handler = RotatingFileHandler(
+        os.path.join(log_dir, 'app.log'),
+        maxBytes=5000 * 1024,  # 5000 lines approximately (assuming average line length of 1KB)
+        backupCount=3  # Keep 3 backup files (4 files total)
+    )
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(LOG_FORMATTER)
+
+    # Route records through a queue so formatting and file I/O happen on a listener thread
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    queue_handler.app_listener = listener
+    logger.addHandler(queue_handler)
+    listener.start()
+    return listener
 
+def shutdown_logging(listener: QueueListener) -> None:
+    """Stop the queue listener and log straight to its handlers for the rest of shutdown"""
+    listener.stop()
+    logger = logging.getLogger()
+    for handler in list(logger.handlers):
+        if getattr(handler, 'app_listener', None) is listener:
+            logger.removeHandler(handler)
+    for handler in listener.handlers:
+        logger.addHandler(handler)
+
+
+# Configure logging
+log_listener = configure_logging()
 logger = logging.getLogger()
-logger.setLevel(logging.DEBUG)
-
-# Create console handler with INFO level
-console_handler = logging.StreamHandler()
-console_handler.setLevel(logging.INFO)
-console_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-console_handler.setFormatter(console_formatter)
-
-# Create file handler with DEBUG level and rotation
-file_handler = RotatingFileHandler(
-    os.path.join(log_dir, 'app.log'),
-    maxBytes=5000 * 1024,  # 5000 lines approximately (assuming average line length of 1KB)
-    backupCount=3  # Keep 3 backup files (4 files total)
-)
-file_handler.setLevel(logging.DEBUG)
-file_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-file_handler.setFormatter(file_formatter)
-
-# Add handlers to logger
-logger.addHandler(console_handler)
-logger.addHandler(file_handler)
 
 # Set third-party loggers to INFO level to reduce noise
 logging.getLogger('urllib3').setLevel(logging.INFO)
@@ -47,16 +79,54 @@ logging.getLogger('httpcore').setLevel(logging.INFO)
 logging.getLogger('apscheduler').setLevel(logging.INFO)
 
 # Initialize clients
-sonarr = Sonarr(api_key=os.getenv('SONARR_API_KEY'), base_url=os.getenv('SONARR_URL'), log_level=logging.DEBUG, logger=logger)
-notion = NotionDB(token=os.getenv('NOTION_TOKEN'), logger=logger, log_level=logging.DEBUG)
-youtube = YouTubeAPI(api_key=os.getenv('YOUTUBE_API_KEY'), log_level=logging.DEBUG, logger=logger)
+sonarr = Sonarr(api_key=settings.sonarr_api_key, base_url=settings.sonarr_url, log_level=logging.DEBUG, logger=logger)
+notion = NotionDB(token=settings.notion_token, logger=logger, log_level=logging.DEBUG)
+youtube = YouTubeAPI(api_key=settings.youtube_api_key, log_level=logging.DEBUG, logger=logger)
 
-# Initialize FastAPI app
-app = initialize_api(sonarr)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared resources and start scheduled tasks; release them on shutdown"""
+    # One pooled HTTP session shared by the Sonarr, Notion and YouTube clients
+    http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=32,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True
+        ),
+        timeout=aiohttp.ClientTimeout(total=30, connect=10)
+    )
+    app.state.http_session = http_session
+    for client in (sonarr, notion, youtube):
+        client.use_session(http_session)
+
+    # Cache warm-up and the initial Notion sync run in the background
+    scheduler, tasks = await ScheduledTasks.initialize_scheduler(notion, sonarr, youtube, logger)
+    try:
+        yield
+    finally:
+        # Stop the warm-up before its HTTP sessions are closed underneath it
+        await tasks.cancel_warm_up()
+        scheduler.shutdown(wait=False)
+        await http_session.close()
+        await NotionDB.close_shared_session()
+        shutdown_logging(log_listener)
 
-# Register startup handler
-ScheduledTasks.register_startup_handler(app, notion, sonarr, youtube, logger)
+# Initialize FastAPI app
+app = initialize_api(sonarr, lifespan=lifespan)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Each worker runs its own scheduler, so raise WEB_CONCURRENCY with care
+    # Pass the app object for a single worker so this module isn't imported a second time as
+    # "main"; multiple workers need the import string so each process can load the app
+    uvicorn.run(
+        app if settings.web_concurrency == 1 else "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=settings.web_concurrency,
+        log_config=None
+    )
@@ -1,13 +1,22 @@
 import logging
-import os
-import json
+import orjson
 from enum import Enum
 import aiohttp
-from typing import Dict, List, Optional, Any, Union, Tuple
-from datetime import datetime
+from yarl import URL
+from cachetools import TTLCache
+from typing import AsyncIterable, AsyncIterator, Callable, Dict, Iterable, List, Optional, Any, Union, Tuple
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import asyncio
-from asyncio import Lock, Semaphore
+import hashlib
+import os
+import random
+import tempfile
+import threading
+from asyncio import Semaphore
 import time
+from pathlib import Path
+from settings import get_settings
 
 class NotionPropertyType(Enum):
     TITLE = "title"
@@ -31,131 +40,539 @@ class NotionPropertyType(Enum):
     LAST_EDITED_BY = "last_edited_by"
 
 
+# Parsed once; aiohttp takes yarl URLs as-is instead of re-parsing a string per request
+NOTION_API_URL = URL("https://api.notion.com/v1")
+NOTION_VERSION = "2022-06-28"
+
+# Headers common to every Notion request; only Authorization varies per client
+_BASE_HEADERS = (
+    ("Content-Type", "application/json"),
+    ("Notion-Version", NOTION_VERSION),
+)
+
+# Invariant request bodies, shared rather than rebuilt per call; never mutated
+# (iter_search copies the body before adding pagination fields)
+_DATABASE_FILTER = {"property": "object", "value": "database"}
+_PAGE_FILTER = {"property": "object", "value": "page"}
+_SEARCH_SORT = {"direction": "ascending", "timestamp": "last_edited_time"}
+_SEARCH_DATABASES_BODY = {"filter": _DATABASE_FILTER}
+_ARCHIVE_BODY = orjson.dumps({"archived": True})  # Sent once per archived page, so encoded up front
+
+
 class NotionDBError(Exception):
     """Base exception for Notion DB operations"""
     pass
 
 
+class NotionNotFoundError(NotionDBError):
+    """The requested object no longer exists or isn't shared with the integration"""
+    pass
+
+
+def _format_multi_select(value: Any) -> dict:
+    """Format a multi-select property from a list of option names"""
+    if type(value) is str:
+        # A single name is one option, not an iterable of characters
+        return {"multi_select": [{"name": value}]}
+    return {"multi_select": [{"name": str(item)} for item in value]}
+
+
+def _format_date(value: Any) -> dict:
+    """Format a date property from a datetime or an ISO 8601 string"""
+    if type(value) is datetime:
+        return {"date": {"start": value.isoformat()}}
+    return {"date": {"start": str(value)}}
+
+
+def _external_file(url: str, name: Optional[str] = None) -> dict:
+    """Build an external file object, naming it after the URL's last path segment by default"""
+    return {
+        "type": "external",
+        "name": name or url.rpartition('/')[2] or 'External File',
+        "external": {
+            "url": url
+        }
+    }
+
+
+def _format_files(value: Any) -> dict:
+    """Format a files property from a URL, a {'url', 'name'} dict or pre-formatted file objects"""
+    if type(value) is list:
+        # Already a list of file objects - pass through without wrapping
+        return {"files": value}
+    if type(value) is str:
+        return {"files": [_external_file(value)]}
+    if isinstance(value, dict) and 'url' in value:
+        # If just given a URL, format it as an external file
+        return {"files": [_external_file(value['url'], value.get('name'))]}
+    # Otherwise assume it's a single file object in the correct format
+    return {"files": [value]}
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    """Seconds to wait from a Retry-After header, given as delta-seconds or an HTTP-date"""
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+async def _aiter_from(items: Iterable[str]) -> AsyncIterator[str]:
+    """Adapt a plain iterable to an async iterator"""
+    for item in items:
+        yield item
+
+
 class NotionDB:
-    def __init__(self, token: str, logger: logging.Logger, log_level: int = logging.INFO):
+    # Process-wide session reused by every instance that isn't given one
+    _shared_session: Optional[aiohttp.ClientSession] = None
+
+    # Serialises read-modify-write of the disk cache file across instances and worker threads
+    _disk_cache_lock = threading.Lock()
+
+    # Notion allows ~3 requests per second; never have more than this many in flight
+    MAX_CONCURRENT_REQUESTS = 3
+
+    # Max page archives in flight per bulk delete - matched to the request limit so
+    # no more archive tasks are started than can actually be sent
+    ARCHIVE_CONCURRENCY = MAX_CONCURRENT_REQUESTS
+
+    # Database objects (schemas) change rarely; keep them for a few minutes
+    DATABASE_CACHE_TTL = 300
+
+    # Child database listings persisted to disk are trusted for a day before being refetched
+    DISK_CACHE_TTL = 24 * 60 * 60
+
+    # Name -> page/database info lookups, refreshed hourly so renames are picked up
+    NAME_CACHE_TTL = 3600
+
+    # Workspace-wide search results are kept briefly for callers that opt in
+    SEARCH_CACHE_TTL = 60
+
+    # Retry policy for rate limits (429), transient server errors and connection failures
+    MAX_RETRIES = 5
+    RETRY_BASE_DELAY = 0.5
+    RETRY_MAX_DELAY = 30
+    RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+    RETRY_AFTER_JITTER = 1.0  # Max seconds added to Retry-After so waiting requests don't retry in lockstep
+
+    # Notion accepts at most this many blocks per children.append request
+    MAX_BLOCK_CHILDREN = 100
+
+    # Rows per database query page (Notion's maximum)
+    QUERY_PAGE_SIZE = 100
+
+    # Title of the single row holding YouTube channel stats
+    YOUTUBE_STATS_ROW_TITLE = "Channel Stats"
+
+    # (column, property type, stats key, default) for each YouTube stats value
+    _YOUTUBE_STATS_COLUMNS = (
+        ("Subscriber Count", NotionPropertyType.NUMBER, 'subscriberCount', 0),
+        ("Video Count", NotionPropertyType.NUMBER, 'videoCount', 0),
+        ("View Count", NotionPropertyType.NUMBER, 'viewCount', 0),
+    )
+
+    def __init__(self, token: str, logger: logging.Logger, log_level: int = logging.INFO, session: Optional[aiohttp.ClientSession] = None):
         self.token = token
         self.logger = logger
         self.logger.setLevel(log_level)
-        self.headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json",
-            "Notion-Version": "2022-06-28"
-        }
-        self.base_url = "https://api.notion.com/v1"
-        self.session = None
-        self._page_cache = {}  # Cache for page info
-        self._db_cache = {}  # Cache for database info
+        self.headers = dict(_BASE_HEADERS, Authorization=f"Bearer {self.token}")
+        self.base_url = NOTION_API_URL
+        self.session = session
+        self._page_cache: TTLCache = TTLCache(maxsize=256, ttl=self.NAME_CACHE_TTL)  # page name -> page info
+        self._db_cache: TTLCache = TTLCache(maxsize=256, ttl=self.NAME_CACHE_TTL)  # database name -> database info
+        self._database_cache: TTLCache = TTLCache(maxsize=256, ttl=self.DATABASE_CACHE_TTL)  # database_id -> database object
+        self._child_databases_cache: TTLCache = TTLCache(maxsize=64, ttl=self.DATABASE_CACHE_TTL)  # page_id -> child databases
+        self._search_cache: TTLCache = TTLCache(maxsize=128, ttl=self.SEARCH_CACHE_TTL)  # canonical search body -> results
+        self._title_page_ids: Dict[Tuple[str, str], str] = {}  # (database_id, title) -> page_id of rows written by upsert_row_by_title
+        self._title_property_names: Dict[str, str] = {}  # database_id -> name of its title property
+        self._inflight: Dict[str, asyncio.Task] = {}  # request key -> in-flight read shared by concurrent callers
+        cache_file = get_settings().notion_cache_file
+        self.disk_cache_path = Path(cache_file).expanduser() if cache_file else None  # page_id -> child databases, across restarts
         
         # Rate limiting
-        self.request_semaphore = Semaphore(3)  # Max 3 concurrent requests
-        self.last_request_time = 0
+        self.request_semaphore = Semaphore(self.MAX_CONCURRENT_REQUESTS)
         self.min_request_interval = 0.34  # ~3 requests per second
-        self.request_lock = Lock()
+        self.next_request_slot = 0.0  # Monotonic time the next request may be sent
+        self.rate_limited_until = 0.0  # After a 429, no request is sent before this (monotonic) time
         
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession(headers=self.headers)
+        if not self.session:
+            self.session = await NotionDB.get_shared_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        # Sessions are shared and outlive this instance; see close_shared_session
+        pass
+
+    def use_session(self, session: aiohttp.ClientSession) -> None:
+        """Use a shared aiohttp session owned (and closed) by the caller"""
+        self.session = session
+
+    @classmethod
+    async def get_shared_session(cls) -> aiohttp.ClientSession:
+        """Get the process-wide Notion session, creating it with a tuned connector on first use
+        
+        Nothing is awaited between the check and the assignment, so concurrent callers on a loop
+        can't create two sessions and no lock (which would be bound to one event loop) is needed.
+        """
+        if cls._shared_session is None or cls._shared_session.closed:
+            cls._shared_session = aiohttp.ClientSession(
+                # Sized for Notion's ~3 req/s limit; request_semaphore caps in-flight requests at 3
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    limit_per_host=10,
+                    keepalive_timeout=75,
+                    use_dns_cache=True,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return cls._shared_session
+
+    @classmethod
+    async def close_shared_session(cls) -> None:
+        """Close the process-wide Notion session if it was created"""
+        if cls._shared_session is not None and not cls._shared_session.closed:
+            await cls._shared_session.close()
+        cls._shared_session = None
 
     async def _wait_for_rate_limit(self):
-        """Wait if needed to respect rate limits"""
-        async with self.request_lock:
-            current_time = time.time()
-            time_since_last = current_time - self.last_request_time
-            if time_since_last < self.min_request_interval:
-                await asyncio.sleep(self.min_request_interval - time_since_last)
-            self.last_request_time = time.time()
-
-    async def _make_request(self, method: str, endpoint: str, data: Optional[dict] = None, params: Optional[dict] = None) -> dict:
-        """Make an HTTP request to the Notion API with rate limiting and retries"""
+        """Wait if needed to respect rate limits
+        
+        Each caller claims the next free slot synchronously and then sleeps on its own, so
+        waits overlap instead of queueing behind a lock; no await happens between reading
+        and advancing next_request_slot, so claims can't interleave.
+        """
+        now = time.monotonic()
+        slot = max(now, self.next_request_slot, self.rate_limited_until)
+        self.next_request_slot = slot + self.min_request_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+        # A 429 seen by another request while this one waited pushes it back too
+        backoff = self.rate_limited_until - time.monotonic()
+        if backoff > 0:
+            await asyncio.sleep(backoff)
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retrying: Retry-After if usable, else capped exponential backoff, both jittered"""
+        if retry_after:
+            wait = _parse_retry_after(retry_after)
+            if wait is not None:
+                return min(wait, self.RETRY_MAX_DELAY) + random.uniform(0, self.RETRY_AFTER_JITTER)
+        delay = min(self.RETRY_BASE_DELAY * (2 ** attempt), self.RETRY_MAX_DELAY)
+        return random.uniform(delay / 2, delay)
+
+    async def _make_request(self, method: str, endpoint: str, data: Union[dict, bytes, None] = None, params: Optional[dict] = None, retry_on_timeout: bool = True) -> dict:
+        """Make an HTTP request to the Notion API with rate limiting and retries
+        
+        Pass retry_on_timeout=False for non-idempotent writes: a timeout or dropped connection
+        after the request was sent may follow a committed write, so only failures to connect
+        are retried.
+        """
         if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+            self.session = await NotionDB.get_shared_session()
 
-        url = f"{self.base_url}/{endpoint}"
-        max_retries = 3
-        base_delay = 1  # Start with 1 second delay
+        url = self.base_url / endpoint
+        # Encode once with orjson (constant bodies arrive pre-encoded); Content-Type is already set in self.headers
+        body = data if data is None or isinstance(data, bytes) else orjson.dumps(data)
         
-        async with self.request_semaphore:  # Limit concurrent requests
-            for attempt in range(max_retries):
+        for attempt in range(self.MAX_RETRIES):
+            last_attempt = attempt == self.MAX_RETRIES - 1
+            # Hold a concurrency slot per attempt only, so a request waiting to retry
+            # doesn't keep another caller from being sent
+            async with self.request_semaphore:
                 try:
                     await self._wait_for_rate_limit()
-                    async with self.session.request(method, url, json=data, params=params) as response:
-                        if response.status == 429:  # Too Many Requests
-                            retry_after = int(response.headers.get('Retry-After', base_delay * (2 ** attempt)))
-                            self.logger.warning(f"Rate limited. Waiting {retry_after} seconds before retry.")
-                            await asyncio.sleep(retry_after)
-                            continue
-                            
-                        if response.status == 400:  # Bad Request
-                            error_body = await response.json()
-                            error_msg = error_body.get('message', 'Unknown error')
-                            self.logger.error(f"Bad request: {error_msg}")
-                            raise NotionDBError(f"Bad request: {error_msg}")
-                            
-                        response.raise_for_status()
-                        return await response.json()
+                    async with self.session.request(method, url, data=body, params=params, headers=self.headers) as response:
+                        # Rate limited or transient server error - retry unless out of attempts
+                        if response.status in self.RETRYABLE_STATUSES and not last_attempt:
+                            delay = self._retry_delay(attempt, response.headers.get('Retry-After'))
+                            if response.status == 429:
+                                # Hold back every request on this client, not just this retry
+                                self.rate_limited_until = max(self.rate_limited_until, time.monotonic() + delay)
+                            self.logger.warning("Notion API returned %s. Retrying in %.2f seconds...", response.status, delay)
+                        else:
+                            if response.status == 400:  # Bad Request
+                                error_body = orjson.loads(await response.read())
+                                error_msg = error_body.get('message', 'Unknown error')
+                                self.logger.error("Bad request: %s", error_msg)
+                                raise NotionDBError(f"Bad request: {error_msg}")
+                            if response.status == 404:
+                                raise NotionNotFoundError(f"Not found: {endpoint}")
+                                
+                            response.raise_for_status()
+                            return orjson.loads(await response.read())
                         
-                except aiohttp.ClientError as e:
-                    if attempt == max_retries - 1:  # Last attempt
-                        self.logger.error(f"Error making request to Notion API: {str(e)}")
-                        raise NotionDBError(f"Error making request to Notion API: {str(e)}") from e
+                except aiohttp.ClientResponseError as e:
+                    # Any error status still unhandled here isn't retryable (or retries are exhausted)
+                    self.logger.error("Notion API returned %s for %s", e.status, endpoint)
+                    raise NotionDBError(f"Notion API returned {e.status} for {endpoint}: {e.message}") from e
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    # Connection failures and session timeouts (ClientTimeout) are both transient,
+                    # but only a failed connect is certain not to have reached Notion
+                    if last_attempt or not (retry_on_timeout or isinstance(e, aiohttp.ClientConnectorError)):
+                        # repr, since a timeout's str() is empty
+                        self.logger.error("Error making request to Notion API: %r", e)
+                        raise NotionDBError(f"Error making request to Notion API: {e!r}") from e
                     
-                    delay = base_delay * (2 ** attempt)  # Exponential backoff
-                    self.logger.warning(f"Request failed. Retrying in {delay} seconds...")
-                    await asyncio.sleep(delay)
+                    delay = self._retry_delay(attempt)
+                    self.logger.warning("Request failed. Retrying in %.2f seconds...", delay)
+
+            # Sleep after the response and the concurrency slot are released
+            await asyncio.sleep(delay)
+
+    async def _coalesced_get(self, endpoint: str) -> dict:
+        """GET an endpoint, sharing one in-flight request between concurrent callers"""
+        task = self._inflight.get(endpoint)
+        if task is None:
+            task = asyncio.ensure_future(self._make_request("GET", endpoint))
+            self._inflight[endpoint] = task
+            task.add_done_callback(lambda _: self._inflight.pop(endpoint, None))
+        # Shield so one caller being cancelled doesn't cancel the request for the others
+        return await asyncio.shield(task)
 
     async def get_database(self, database_id: str) -> dict:
-        """Get a database by ID"""
-        return await self._make_request("GET", f"databases/{database_id}")
+        """Get a database by ID, served from a short-lived cache when possible"""
+        database = self._database_cache.get(database_id)
+        if database is None:
+            try:
+                database = await self._coalesced_get(f"databases/{database_id}")
+            except NotionNotFoundError:
+                await self.invalidate_cache(database_id)
+                raise
+            self._database_cache[database_id] = database
+        return database
+
+    async def get_page(self, page_id: str) -> dict:
+        """Get a page (database row) by ID"""
+        return await self._coalesced_get(f"pages/{page_id}")
+
+    async def invalidate_cache(self, database_id: Optional[str] = None) -> None:
+        """Drop cached database objects after a schema change or once a database is gone
+        
+        Args:
+            database_id (Optional[str]): Database to drop; all cached databases if omitted
+        """
+        if database_id:
+            self._database_cache.pop(database_id, None)
+            # Name lookups and upserted row IDs that resolved to this database are stale too
+            for key in [key for key, info in self._db_cache.items() if info['id'] == database_id]:
+                del self._db_cache[key]
+            for key in [key for key in self._title_page_ids if key[0] == database_id]:
+                del self._title_page_ids[key]
+        else:
+            self._database_cache.clear()
+            self._db_cache.clear()
+            self._title_page_ids.clear()
+        # Child database listings and search results carry titles, which may have changed too
+        self._child_databases_cache.clear()
+        self._search_cache.clear()
+        self._page_cache.clear()
+        if self.disk_cache_path:
+            await asyncio.to_thread(self._drop_from_disk_cache, database_id or None)
+
+    def _read_disk_cache(self) -> Dict[str, dict]:
+        """Load the persisted child database listings, treating an unreadable file as empty"""
+        try:
+            return orjson.loads(self.disk_cache_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, orjson.JSONDecodeError) as e:
+            self.logger.warning("Ignoring unreadable Notion cache file %s: %s", self.disk_cache_path, e)
+            return {}
+
+    def _write_disk_cache(self, page_id: str, databases: Dict[str, dict]) -> None:
+        """Persist one page's child databases, replacing the file atomically
+        
+        The lock keeps concurrent updates (e.g. jobs firing together) from overwriting each
+        other, and each write goes through its own temp file in the target directory.
+        """
+        digest = hashlib.sha256(orjson.dumps(databases, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        with self._disk_cache_lock:
+            entries = self._read_disk_cache()
+            previous = entries.get(page_id)
+            if previous and previous.get('hash') != digest:
+                self.logger.info("Child databases of page %s changed since they were cached", page_id)
+            entries[page_id] = {'fetched_at': time.time(), 'hash': digest, 'databases': databases}
+            self._replace_disk_cache(entries)
+
+    def _drop_from_disk_cache(self, database_id: Optional[str] = None) -> None:
+        """Remove persisted listings that include a database, or the whole file if none is given"""
+        with self._disk_cache_lock:
+            if database_id is None:
+                try:
+                    self.disk_cache_path.unlink(missing_ok=True)
+                except OSError as e:
+                    self.logger.warning("Could not remove Notion cache file %s: %s", self.disk_cache_path, e)
+                return
+            entries = self._read_disk_cache()
+            kept = {
+                page_id: entry for page_id, entry in entries.items()
+                if all(db.get('id') != database_id for db in entry.get('databases', {}).values())
+            }
+            if len(kept) != len(entries):
+                self._replace_disk_cache(kept)
+
+    def _replace_disk_cache(self, entries: Dict[str, dict]) -> None:
+        """Atomically write the cache file through a temp file in its directory; call with the lock held"""
+        tmp_path = None
+        try:
+            self.disk_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=self.disk_cache_path.parent, prefix=self.disk_cache_path.name, suffix='.tmp', delete=False) as tmp_file:
+                tmp_path = tmp_file.name
+                tmp_file.write(orjson.dumps(entries))
+            os.replace(tmp_path, self.disk_cache_path)
+        except OSError as e:
+            self.logger.warning("Could not write Notion cache file %s: %s", self.disk_cache_path, e)
+            if tmp_path:
+                Path(tmp_path).unlink(missing_ok=True)
+
+    async def _load_cached_child_databases(self, page_id: str) -> Optional[Dict[str, dict]]:
+        """Child databases of a page from the disk cache, if present and fresh"""
+        if not self.disk_cache_path:
+            return None
+        entry = (await asyncio.to_thread(self._read_disk_cache)).get(page_id)
+        if entry and time.time() - entry.get('fetched_at', 0) < self.DISK_CACHE_TTL:
+            return entry['databases']
+        return None
 
     async def get_database_by_name(self, database_name: str, page_id: Optional[str] = None) -> Optional[dict]:
-        """Get a database by name from a parent page"""
+        """Get a database by its exact title, optionally only among the children of a parent page
+        
+        Returns:
+            Optional[dict]: The database object, or None if no database has that title
+        """
         try:
-            databases = await self.get_child_databases(page_id) if page_id else await self.search_databases()
-            return next((db for db in databases if db['title'] == database_name), None)
+            for db in await self.search_databases(cache=True):
+                if page_id:
+                    db_parent = db.get('parent', {})
+                    if db_parent.get('type') != 'page_id' or db_parent.get('page_id') != page_id:
+                        continue
+                if self._extract_page_title(db) == database_name:
+                    return db
+            return None
         except Exception as e:
-            self.logger.error(f"Error getting database by name: {str(e)}")
+            self.logger.error("Error getting database by name: %s", e)
             raise NotionDBError(f"Error getting database by name: {str(e)}") from e
 
+    async def iter_block_children(self, block_id: str) -> AsyncIterator[dict]:
+        """Yield every child block of a page or block, following pagination"""
+        params = {"page_size": self.QUERY_PAGE_SIZE}
+        while True:
+            results = await self._make_request("GET", f"blocks/{block_id}/children", params=params)
+            for block in results.get('results', []):
+                yield block
+            if not results.get('has_more'):
+                break
+            params["start_cursor"] = results['next_cursor']
+
     async def get_child_databases(self, page_id: str) -> Dict[str, dict]:
         """Get all child databases of a page"""
-        self.logger.debug(f"Getting child databases for page ID: {page_id}")
+        self.logger.debug("Getting child databases for page ID: %s", page_id)
         if not page_id:
             raise NotionDBError("Page ID cannot be None or empty")
             
+        cached = self._child_databases_cache.get(page_id)
+        if cached is not None:
+            return cached
+        
+        cached = await self._load_cached_child_databases(page_id)
+        if cached is not None:
+            self.logger.debug("Using %s child databases of page %s from disk cache", len(cached), page_id)
+            self._child_databases_cache[page_id] = cached
+            return cached
+            
         try:
-            results = await self._make_request("GET", f"blocks/{page_id}/children")
+            # child_database blocks carry the database title, so no per-database lookup is needed
             databases = {}
-            for block in results.get('results', []):
+            async for block in self.iter_block_children(page_id):
                 if block['type'] == 'child_database':
-                    db_id = block['id']
-                    db_info = await self.get_database(db_id)
-                    title = db_info['title'][0]['plain_text'] if db_info.get('title') else ''
-                    databases[title] = {'id': db_id, 'title': title}
-            self.logger.debug(f"Found {len(databases)} child databases")
+                    title = block['child_database'].get('title', '')
+                    databases[title] = {'id': block['id'], 'title': title}
+            self.logger.debug("Found %s child databases", len(databases))
+            self._child_databases_cache[page_id] = databases
+            if self.disk_cache_path:
+                await asyncio.to_thread(self._write_disk_cache, page_id, databases)
             return databases
         except Exception as e:
-            self.logger.error(f"Error getting child databases for page {page_id}: {str(e)}")
+            self.logger.error("Error getting child databases for page %s: %s", page_id, e)
             raise NotionDBError(f"Error getting child databases: {str(e)}") from e
 
-    async def search_databases(self) -> List[dict]:
-        """Search for databases"""
-        results = await self._make_request("POST", "search", {"filter": {"property": "object", "value": "database"}})
-        return results.get('results', [])
+    async def iter_search(self, data: dict) -> AsyncIterator[dict]:
+        """Yield every result of a search request, following pagination"""
+        data = {**data, "page_size": self.QUERY_PAGE_SIZE}
+        while True:
+            results = await self._make_request("POST", "search", data)
+            for result in results.get('results', []):
+                yield result
+            if not results.get('has_more'):
+                break
+            data["start_cursor"] = results['next_cursor']
 
-    async def query_database(self, database_id: str, filter_params: Optional[dict] = None) -> List[dict]:
-        """Query a database with optional filters"""
+    async def search(self, data: dict, cache: bool = False) -> List[dict]:
+        """Run a search request and return every result
+        
+        Args:
+            data (dict): Search request body
+            cache (bool): Serve identical searches from a short-lived cache (default: False)
+        """
+        if not cache:
+            return [result async for result in self.iter_search(data)]
+        key = orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        results = self._search_cache.get(key)
+        if results is None:
+            results = [result async for result in self.iter_search(data)]
+            self._search_cache[key] = results
+        return results
+
+    async def search_databases(self, cache: bool = False) -> List[dict]:
+        """Search for databases, returning every accessible database"""
+        return await self.search(_SEARCH_DATABASES_BODY, cache=cache)
+
+    async def _query_database_page(self, database_id: str, data: dict) -> dict:
+        """Fetch one page of database query results"""
+        try:
+            return await self._make_request("POST", f"databases/{database_id}/query", data)
+        except NotionNotFoundError:
+            # The database was deleted or unshared - stop serving it from the caches
+            await self.invalidate_cache(database_id)
+            raise
+
+    async def iter_database(self, database_id: str, filter_params: Optional[dict] = None, page_size: int = QUERY_PAGE_SIZE) -> AsyncIterator[dict]:
+        """Yield every page in a database matching optional filters, following pagination
+        
+        The next result page is requested before the current one is yielded, so fetching
+        overlaps with whatever the caller does per page.
+        """
         data = {"filter": filter_params} if filter_params else {}
-        results = await self._make_request("POST", f"databases/{database_id}/query", data)
-        return results.get('results', [])
+        data["page_size"] = page_size
+        request: Optional[asyncio.Task] = asyncio.ensure_future(self._query_database_page(database_id, data))
+        try:
+            while request:
+                results = await request
+                request = None
+                if results.get('has_more'):
+                    data = {**data, "start_cursor": results['next_cursor']}
+                    request = asyncio.ensure_future(self._query_database_page(database_id, data))
+                for page in results.get('results', []):
+                    yield page
+        finally:
+            # Caller stopped early or a request failed - don't leave a prefetch running
+            if request and not request.done():
+                request.cancel()
+
+    async def query_database(self, database_id: str, filter_params: Optional[dict] = None) -> List[dict]:
+        """Query a database with optional filters, returning all matching pages"""
+        return [page async for page in self.iter_database(database_id, filter_params)]
 
     async def create_page(self, database_id: str, properties: dict) -> dict:
         """Create a new page in a database"""
@@ -163,7 +580,11 @@ class NotionDB:
             "parent": {"database_id": database_id},
             "properties": properties
         }
-        return await self._make_request("POST", "pages", data)
+        try:
+            return await self._make_request("POST", "pages", data, retry_on_timeout=False)
+        except NotionNotFoundError:
+            await self.invalidate_cache(database_id)
+            raise
 
     async def update_page(self, page_id: str, properties: dict) -> dict:
         """Update a page's properties"""
@@ -171,16 +592,85 @@ class NotionDB:
 
     async def delete_page(self, page_id: str) -> dict:
         """Archive a page"""
-        return await self._make_request("PATCH", f"pages/{page_id}", {"archived": True})
+        return await self._make_request("PATCH", f"pages/{page_id}", _ARCHIVE_BODY)
+
+    async def append_block_children(self, block_id: str, children: List[dict]) -> List[dict]:
+        """Append blocks to a page or block, batching up to MAX_BLOCK_CHILDREN blocks per request
+        
+        Batches are sent in order so the appended blocks keep their sequence.
+        
+        Args:
+            block_id (str): ID of the parent page or block
+            children (List[dict]): Block objects to append
+            
+        Returns:
+            List of appended block objects
+        """
+        appended = []
+        for start in range(0, len(children), self.MAX_BLOCK_CHILDREN):
+            batch = children[start:start + self.MAX_BLOCK_CHILDREN]
+            results = await self._make_request("PATCH", f"blocks/{block_id}/children", {"children": batch}, retry_on_timeout=False)
+            appended.extend(results.get('results', []))
+        return appended
+
+    async def archive_pages(self, page_ids: Union[Iterable[str], AsyncIterable[str]]) -> int:
+        """Archive pages concurrently and return how many were archived successfully
+        
+        Notion has no bulk archive endpoint, so each page is its own PATCH. At most
+        ARCHIVE_CONCURRENCY archives are in flight and a new one starts as soon as any finishes,
+        so there is no per-batch barrier; given an async iterable (e.g. a streaming query),
+        IDs are consumed as they arrive, overlapping the query with the archives.
+        
+        Args:
+            page_ids (Union[Iterable[str], AsyncIterable[str]]): IDs of the pages to archive
+            
+        Returns:
+            int: Number of pages archived
+        """
+        if not isinstance(page_ids, AsyncIterable):
+            page_ids = _aiter_from(page_ids)
+
+        pending: Dict[asyncio.Task, str] = {}  # archive task -> page_id
+        archived_count = 0
+        failed_count = 0
+
+        def collect(done) -> None:
+            nonlocal archived_count, failed_count
+            for task in done:
+                page_id = pending.pop(task)
+                if task.exception():
+                    failed_count += 1
+                    self.logger.debug("Error archiving page %s: %s", page_id, task.exception())
+                else:
+                    archived_count += 1
 
-    async def clear_database(self, database_id: str) -> None:
-        """Clear all entries in a database"""
         try:
-            pages = await self.query_database(database_id)
-            for page in pages:
-                await self.delete_page(page['id'])
+            async for page_id in page_ids:
+                if len(pending) >= self.ARCHIVE_CONCURRENCY:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    collect(done)
+                pending[asyncio.create_task(self.delete_page(page_id))] = page_id
+            if pending:
+                done, _ = await asyncio.wait(pending)
+                collect(done)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if failed_count:
+            self.logger.error("Failed to archive %s of %s pages", failed_count, archived_count + failed_count)
+        return archived_count
+
+    def _iter_page_ids(self, database_id: str, filter_params: Optional[dict] = None) -> AsyncIterator[str]:
+        """Stream the IDs of pages matching a filter"""
+        return (page['id'] async for page in self.iter_database(database_id, filter_params))
+
+    async def clear_database(self, database_id: str) -> int:
+        """Clear all entries in a database, returning the number of pages archived"""
+        try:
+            return await self.archive_pages(self._iter_page_ids(database_id))
         except Exception as e:
-            self.logger.error(f"Error clearing database: {str(e)}")
+            self.logger.error("Error clearing database: %s", e)
             raise NotionDBError(f"Error clearing database: {str(e)}") from e
 
     async def create_or_update_row(self, database_id: str, properties: dict, filter_params: Optional[dict] = None) -> dict:
@@ -192,9 +682,38 @@ class NotionDB:
                     return await self.update_page(existing_pages[0]['id'], properties)
             return await self.create_page(database_id, properties)
         except Exception as e:
-            self.logger.error(f"Error creating/updating row: {str(e)}")
+            self.logger.error("Error creating/updating row: %s", e)
             raise NotionDBError(f"Error creating/updating row: {str(e)}") from e
 
+    async def upsert_row_by_title(self, database_id: str, title: str, properties: dict, title_property: str = "Name") -> dict:
+        """Update the row whose title equals `title`, or create it if none exists
+        
+        The resolved page ID is remembered so later upserts of the same row skip the lookup query.
+        
+        Args:
+            database_id (str): ID of the database
+            title (str): Title value identifying the row
+            properties (dict): Formatted properties to write
+            title_property (str): Name of the database's title property (default: "Name")
+            
+        Returns:
+            dict: Updated or created page object
+        """
+        key = (database_id, title)
+        page_id = self._title_page_ids.get(key)
+        if page_id:
+            try:
+                return await self.update_page(page_id, properties)
+            except NotionDBError as e:
+                # Page was archived or deleted since it was cached - look it up again
+                self.logger.debug("Cached page %s for %s is no longer writable: %s", page_id, title, e)
+                self._title_page_ids.pop(key, None)
+        
+        filter_params = {"property": title_property, "title": {"equals": title}}
+        page = await self.create_or_update_row(database_id, properties, filter_params)
+        self._title_page_ids[key] = page['id']
+        return page
+
     async def delete_pages_where(self, database_id: str, filter_params: dict) -> int:
         """Delete pages in a database that match the filter criteria
         
@@ -215,31 +734,38 @@ class NotionDB:
             }
         """
         try:
-            # Query database with filter
-            pages = await self.query_database(database_id, filter_params)
-            
-            # Delete matching pages
-            deleted_count = 0
-            for page in pages:
-                await self.delete_page(page['id'])
-                deleted_count += 1
+            # Stream matching pages and archive them concurrently as the query yields them
+            deleted_count = await self.archive_pages(self._iter_page_ids(database_id, filter_params))
             
-            self.logger.debug(f"Deleted {deleted_count} pages matching filter in database {database_id}")
+            self.logger.debug("Deleted %s pages matching filter in database %s", deleted_count, database_id)
             return deleted_count
         except Exception as e:
-            self.logger.error(f"Error deleting pages with filter: {str(e)}")
+            self.logger.error("Error deleting pages with filter: %s", e)
             raise NotionDBError(f"Error deleting pages with filter: {str(e)}") from e
 
     def _extract_page_title(self, page: dict) -> Optional[str]:
         """Extract title from page object"""
+        # Database objects carry their title as top-level rich text; their properties are the schema
+        if page.get('object') == 'database':
+            return ''.join(text.get('plain_text', '') for text in page.get('title', [])) or None
+        
         properties = page.get('properties', {})
         title_prop = None
         
-        # First try to find a property of type "title"
-        for prop in properties.values():
-            if prop.get('type') == 'title':
-                title_prop = prop
-                break
+        # Rows of the same database share one title column, so index it directly once known
+        database_id = page.get('parent', {}).get('database_id')
+        title_name = self._title_property_names.get(database_id) if database_id else None
+        if title_name:
+            title_prop = properties.get(title_name)
+        
+        # Otherwise scan for the property of type "title"
+        if not title_prop:
+            for name, prop in properties.items():
+                if prop.get('type') == 'title':
+                    title_prop = prop
+                    if database_id:
+                        self._title_property_names[database_id] = name
+                    break
                 
         # If no title property found, try to get it from child_page title
         if not title_prop and page.get('type') == 'child_page':
@@ -259,68 +785,56 @@ class NotionDB:
         try:
             db = await self.notion_db_yt_channel
             
-            self.logger.debug(f"Updating YouTube stats in database {db['title']}")
-            
-            # Clear existing entries
-            await self.clear_database(db['id'])
+            self.logger.debug("Updating YouTube stats in database %s", db['title'])
             
             # Format properties with correct property names
             properties = {
-                "Name": self.format_property(NotionPropertyType.TITLE, "Channel Stats"),
-                "Subscriber Count": self.format_property(NotionPropertyType.NUMBER, stats.get('subscriberCount', 0)),
-                "Video Count": self.format_property(NotionPropertyType.NUMBER, stats.get('videoCount', 0)),
-                "View Count": self.format_property(NotionPropertyType.NUMBER, stats.get('viewCount', 0)),
-                "Updated At": self.format_property(NotionPropertyType.DATE, datetime.now().isoformat())
+                "Name": self.format_property(NotionPropertyType.TITLE, self.YOUTUBE_STATS_ROW_TITLE),
+                **{
+                    column: self.format_property(prop_type, stats.get(key, default))
+                    for column, prop_type, key, default in self._YOUTUBE_STATS_COLUMNS
+                },
+                "Updated At": self.format_property(NotionPropertyType.DATE, datetime.now()),
             }
             
-            # Create new entry
-            await self.create_or_update_row(database_id=db['id'], properties=properties)
+            # Update the stats row in place, creating it on first run
+            await self.upsert_row_by_title(db['id'], self.YOUTUBE_STATS_ROW_TITLE, properties)
             self.logger.info("Updated YouTube channel stats in Notion")
         except Exception as e:
-            self.logger.error(f"Error updating YouTube channel stats: {str(e)}")
+            self.logger.error("Error updating YouTube channel stats: %s", e)
             raise
 
+    # Property type -> formatter, built once so format_property is a single lookup
+    _PROPERTY_FORMATTERS: Dict[NotionPropertyType, Callable[[Any], dict]] = {
+        NotionPropertyType.TITLE: lambda value: {"title": [{"text": {"content": str(value)}}]},
+        NotionPropertyType.RICH_TEXT: lambda value: {"rich_text": [{"text": {"content": str(value)}}]},
+        NotionPropertyType.NUMBER: lambda value: {"number": float(value) if value is not None else None},
+        NotionPropertyType.SELECT: lambda value: {"select": {"name": str(value)}},
+        NotionPropertyType.MULTI_SELECT: _format_multi_select,
+        NotionPropertyType.DATE: _format_date,
+        NotionPropertyType.CHECKBOX: lambda value: {"checkbox": bool(value)},
+        NotionPropertyType.URL: lambda value: {"url": str(value)},
+        NotionPropertyType.FILES: _format_files,
+    }
+
     @staticmethod
     def format_property(prop_type: NotionPropertyType, value: Any) -> dict:
         """Format a value for a specific Notion property type"""
-        if prop_type == NotionPropertyType.TITLE:
-            return {"title": [{"text": {"content": str(value)}}]}
-        elif prop_type == NotionPropertyType.RICH_TEXT:
-            return {"rich_text": [{"text": {"content": str(value)}}]}
-        elif prop_type == NotionPropertyType.NUMBER:
-            return {"number": float(value) if value is not None else None}
-        elif prop_type == NotionPropertyType.SELECT:
-            return {"select": {"name": str(value)}}
-        elif prop_type == NotionPropertyType.MULTI_SELECT:
-            return {"multi_select": [{"name": str(item)} for item in value]}
-        elif prop_type == NotionPropertyType.DATE:
-            return {"date": {"start": str(value)}}
-        elif prop_type == NotionPropertyType.CHECKBOX:
-            return {"checkbox": bool(value)}
-        elif prop_type == NotionPropertyType.URL:
-            return {"url": str(value)}
-        elif prop_type == NotionPropertyType.FILES:
-            if isinstance(value, dict) and 'url' in value:
-                # If just given a URL, format it as an external file
-                return {"files": [{
-                    "type": "external",
-                    "name": value.get('name', 'External File'),
-                    "external": {
-                        "url": value['url']
-                    }
-                }]}
-            # Otherwise assume it's already in the correct format
-            if not isinstance(value, list):
-                value = [value]
-            return {"files": value}
-        else:
-            raise ValueError(f"Unsupported property type: {prop_type}")
+        formatter = NotionDB._PROPERTY_FORMATTERS.get(prop_type)
+        if formatter is None:
+            raise NotionDBError(f"Unsupported property type: {prop_type}")
+        # Only the value conversions (float, str, iteration) can fail
+        try:
+            return formatter(value)
+        except (TypeError, ValueError) as e:
+            raise NotionDBError(f"Failed to format {prop_type.value} value {value!r}: {str(e)}") from e
 
-    async def get_page_info(self, page_name: str) -> Dict[str, Any]:
+    async def get_page_info(self, page_name: str, cache: bool = True) -> Dict[str, Any]:
         """Get cached page info including its databases.
         
         Args:
             page_name (str): Name of the page as configured in environment variables
+            cache (bool): Use and refresh the cached info; False always looks the page up (default: True)
             
         Returns:
             Dict containing page info with 'name', 'page_id', and 'database_ids'
@@ -329,8 +843,10 @@ class NotionDB:
             NotionDBError: If page cannot be found
         """
         # Check cache first
-        if page_name in self._page_cache:
-            return self._page_cache[page_name]
+        if cache:
+            page_info = self._page_cache.get(page_name)
+            if page_info is not None:
+                return page_info
             
         # Get page info
         page_info = {"name": page_name}
@@ -339,13 +855,14 @@ class NotionDB:
         page_info["database_ids"] = await self.get_child_databases(page_id=page_info["page_id"])
         
         # Cache the result
-        self._page_cache[page_name] = page_info
+        if cache:
+            self._page_cache[page_name] = page_info
         return page_info
         
     @property
     async def notion_page_telly(self) -> Dict[str, Any]:
         """Get cached Telly page info"""
-        page_name = os.getenv('NOTION_PAGE_TELLY')
+        page_name = get_settings().notion_page_telly
         if not page_name:
             raise NotionDBError("NOTION_PAGE_TELLY environment variable is not set")
         return await self.get_page_info(page_name)
@@ -353,7 +870,7 @@ class NotionDB:
     @property
     async def notion_page_youtube(self) -> Dict[str, Any]:
         """Get cached YouTube page info"""
-        page_name = os.getenv('NOTION_PAGE_YOUTUBE')
+        page_name = get_settings().notion_page_youtube
         if not page_name:
             raise NotionDBError("NOTION_PAGE_YOUTUBE environment variable is not set")
         return await self.get_page_info(page_name)
@@ -393,17 +910,7 @@ class NotionDB:
             response = await self._make_request(
                 "POST", 
                 "search", 
-                {
-                    "query": page_name,
-                    "filter": {
-                        "value": "page",
-                        "property": "object"
-                    },
-                    "sort": {
-                        "direction": "ascending",
-                        "timestamp": "last_edited_time"
-                    }
-                }
+                {"query": page_name, "filter": _PAGE_FILTER, "sort": _SEARCH_SORT}
             )
             
             results = response.get('results', [])
@@ -415,7 +922,7 @@ class NotionDB:
             return self._format_page_info(page, page_name)
             
         except Exception as e:
-            self.logger.error(f"Error finding page {page_name}: {str(e)}")
+            self.logger.error("Error finding page %s: %s", page_name, e)
             raise NotionDBError(f"Error finding page {page_name}: {str(e)}") from e
 
     async def find_database(self, database_name: str, parent_id: Optional[str] = None) -> Dict[str, Any]:
@@ -432,54 +939,49 @@ class NotionDB:
             NotionDBError: If database cannot be found
         """
         try:
-            search_params = {
-                "query": database_name,
-                "filter": {
-                    "value": "database",
-                    "property": "object"
-                },
-                "sort": {
-                    "direction": "ascending",
-                    "timestamp": "last_edited_time"
-                }
-            }
+            search_params = {"query": database_name, "filter": _DATABASE_FILTER, "sort": _SEARCH_SORT}
             
             response = await self._make_request("POST", "search", search_params)
-            results = response.get('results', [])
-            if not results:
-                raise NotionDBError(f"Could not find database with name: {database_name}")
+            wanted = database_name.casefold()
             
-            # Return first result since we already filtered by name in search
-            # If parent_id is specified, find the first database with matching parent
-            for db in results:
+            # Search matches titles loosely: prefer an exact title match on this one page of
+            # results, otherwise fall back to the first result (under parent_id, if given)
+            match = None
+            for db in response.get('results', []):
                 if parent_id:
                     db_parent = db.get('parent', {})
-                    if db_parent.get('type') == 'page_id' and db_parent.get('page_id') == parent_id:
-                        db['_query_name'] = database_name  # Add query name to db object
-                        return self._format_database_info(db)
-                else:
-                    db['_query_name'] = database_name  # Add query name to db object
-                    return self._format_database_info(db)
+                    if db_parent.get('type') != 'page_id' or db_parent.get('page_id') != parent_id:
+                        continue
+                if (self._extract_page_title(db) or '').casefold() == wanted:
+                    match = db
+                    break
+                if match is None:
+                    match = db
             
-            if parent_id:
-                raise NotionDBError(f"Could not find database with name: {database_name} under parent: {parent_id}")
+            if match is None:
+                if parent_id:
+                    raise NotionDBError(f"Could not find database with name: {database_name} under parent: {parent_id}")
+                raise NotionDBError(f"Could not find database with name: {database_name}")
+            
+            return self._format_database_info(match, database_name)
             
         except Exception as e:
-            self.logger.error(f"Error finding database {database_name}: {str(e)}")
+            self.logger.error("Error finding database %s: %s", database_name, e)
             raise NotionDBError(f"Error finding database {database_name}: {str(e)}") from e
 
-    def _format_database_info(self, db: Dict[str, Any]) -> Dict[str, Any]:
+    def _format_database_info(self, db: Dict[str, Any], title: Optional[str] = None) -> Dict[str, Any]:
         """Format database information into a consistent structure.
         
         Args:
             db (Dict[str, Any]): Raw database object from Notion API
+            title (Optional[str]): Title already known to the caller, if available
             
         Returns:
             Dict[str, Any]: Formatted database information
         """
         return {
             'id': db['id'],
-            'title': db.get('_query_name', self._extract_page_title(db)),  # Fallback to extracted title if query name not provided
+            'title': title if title is not None else self._extract_page_title(db),  # Only extract when the caller doesn't know it
             'url': db['url'],
             'parent': db.get('parent', {}),
             'created_time': db['created_time'],
@@ -490,25 +992,28 @@ class NotionDB:
     @property
     async def notion_db_tv_calendar(self) -> Dict[str, Any]:
         """Get cached TV Calendar database info"""
-        db_name = os.getenv('NOTION_DB_TV_CALENDAR')
+        settings = get_settings()
+        db_name = settings.notion_db_tv_calendar
         if not db_name:
             raise NotionDBError("NOTION_DB_TV_CALENDAR environment variable is not set")
-        return await self.get_database_info(db_name, os.getenv('NOTION_PAGE_TELLY'))
+        return await self.get_database_info(db_name, settings.notion_page_telly)
 
     @property
     async def notion_db_yt_channel(self) -> Dict[str, Any]:
         """Get cached YouTube Channel database info"""
-        db_name = os.getenv('NOTION_DB_YT_CHANNEL')
+        settings = get_settings()
+        db_name = settings.notion_db_yt_channel
         if not db_name:
             raise NotionDBError("NOTION_DB_YT_CHANNEL environment variable is not set")
-        return await self.get_database_info(db_name, os.getenv('NOTION_PAGE_YOUTUBE'))
+        return await self.get_database_info(db_name, settings.notion_page_youtube)
 
-    async def get_database_info(self, db_name: str, parent_page_name: Optional[str] = None) -> Dict[str, Any]:
+    async def get_database_info(self, db_name: str, parent_page_name: Optional[str] = None, cache: bool = True) -> Dict[str, Any]:
         """Get cached database info.
         
         Args:
             db_name (str): Name of the database as configured in environment variables
             parent_page_name (Optional[str]): Name of the parent page if database is a child
+            cache (bool): Use and refresh the cached info; False always looks the database up (default: True)
             
         Returns:
             Dict containing database info with 'name', 'id', and other metadata
@@ -518,24 +1023,30 @@ class NotionDB:
         """
         # Check cache first
         cache_key = f"{parent_page_name}_{db_name}" if parent_page_name else db_name
-        if cache_key in self._db_cache:
-            return self._db_cache[cache_key]
+        if cache:
+            db_info = self._db_cache.get(cache_key)
+            if db_info is not None:
+                return db_info
         
         # Get parent page ID if specified
         parent_id = None
         if parent_page_name:
-            parent_info = await self.get_page_info(parent_page_name)
+            parent_info = await self.get_page_info(parent_page_name, cache=cache)
             parent_id = parent_info['page_id']
         
         # Find database
         db_info = await self.find_database(db_name, parent_id)
         
         # Cache the result
-        self._db_cache[cache_key] = db_info
+        if cache:
+            self._db_cache[cache_key] = db_info
         return db_info
 
     async def batch_update_pages(self, updates: List[Tuple[str, dict]]) -> List[dict]:
-        """Batch update multiple pages with rate limiting
+        """Batch update multiple pages concurrently with rate limiting
+        
+        Updates are gathered concurrently; request_semaphore in _make_request keeps at most
+        MAX_CONCURRENT_REQUESTS in flight. Results keep the order of `updates`.
         
         Args:
             updates: List of (page_id, properties) tuples
@@ -543,32 +1054,35 @@ class NotionDB:
         Returns:
             List of updated page objects
         """
+        updated = await asyncio.gather(*(self.update_page(page_id, properties) for page_id, properties in updates), return_exceptions=True)
         results = []
-        for page_id, properties in updates:
-            try:
-                result = await self.update_page(page_id, properties)
+        for (page_id, _), result in zip(updates, updated):
+            if isinstance(result, Exception):
+                self.logger.error("Error updating page %s: %s", page_id, result)
+                results.append({"id": page_id, "error": str(result)})
+            else:
                 results.append(result)
-            except Exception as e:
-                self.logger.error(f"Error updating page {page_id}: {str(e)}")
-                results.append({"id": page_id, "error": str(e)})
         return results
 
     async def batch_create_pages(self, database_id: str, pages: List[dict]) -> List[dict]:
-        """Batch create multiple pages with rate limiting
+        """Batch create multiple pages concurrently with rate limiting
+        
+        Notion has no bulk create endpoint, so pages are created concurrently; request_semaphore
+        in _make_request keeps at most MAX_CONCURRENT_REQUESTS in flight. Results keep the order of `pages`.
         
         Args:
             database_id: ID of the database to create pages in
             pages: List of page property dictionaries
-            
+        
         Returns:
             List of created page objects
         """
+        created = await asyncio.gather(*(self.create_page(database_id, properties) for properties in pages), return_exceptions=True)
         results = []
-        for properties in pages:
-            try:
-                result = await self.create_page(database_id, properties)
+        for result in created:
+            if isinstance(result, Exception):
+                self.logger.error("Error creating page: %s", result)
+                results.append({"error": str(result)})
+            else:
                 results.append(result)
-            except Exception as e:
-                self.logger.error(f"Error creating page: {str(e)}")
-                results.append({"error": str(e)})
         return results
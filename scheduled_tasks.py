@@ -1,32 +1,36 @@
 import logging
-import os
 import asyncio
 from datetime import datetime, timedelta
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from notion_db import NotionDB, NotionPropertyType, NotionDBError
 from sonarr import Sonarr
+from settings import get_settings
 from youtube_api import YouTubeAPI
-from fastapi import FastAPI
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 
 class ScheduledTasks:
+    # Max calendar rows upserted into Notion concurrently
+    NOTION_UPSERT_CONCURRENCY = 10
+
     def __init__(self, notion_client: NotionDB, sonarr_client: Sonarr, youtube_client: YouTubeAPI, logger: logging.Logger):
         self.notion = notion_client
         self.sonarr = sonarr_client
         self.youtube = youtube_client
         self.logger = logger
+        self.warm_up_task: Optional[asyncio.Task] = None
 
     async def update_databases(self):
         """Update all databases - runs at startup and midnight"""
 
-        self.logger.info(f"Running scheduled database updates at {datetime.now()}")
+        self.logger.info("Running scheduled database updates at %s", datetime.now())
 
         try:
-            # Get configuration from environment
-            past_days = int(os.getenv('SONARR_PAST_DAYS', '7'))
-            future_days = int(os.getenv('SONARR_FUTURE_DAYS', '14'))
+            # Get configuration
+            settings = get_settings()
+            past_days = settings.sonarr_past_days
+            future_days = settings.sonarr_future_days
 
             # Get database ID
             calendar_db = await self.notion.notion_db_tv_calendar
@@ -34,6 +38,9 @@ class ScheduledTasks:
             # Get calendar episodes
             cals = await self.sonarr.get_episodes_calendar(past_days, future_days)
 
+            # Fetch all series in one call and index by ID for the calendar loop
+            all_series = {show['id']: show for show in await self.sonarr.get_series()}
+
             # Delete old entries
             filter_params = {
                 "property": "Air Date",
@@ -43,12 +50,25 @@ class ScheduledTasks:
             }
             await self.notion.delete_pages_where(calendar_db['id'], filter_params)
             
-            # Add new entries
+            # Index the remaining rows once by (Episode ID, Air Date) instead of querying per episode
+            existing_rows = await self.index_calendar_rows(calendar_db['id'])
+            
+            # Add new entries and update existing ones concurrently
+            upsert_semaphore = asyncio.Semaphore(self.NOTION_UPSERT_CONCURRENCY)
+
+            async def upsert_entry(properties: Dict[str, Any], page_id: Optional[str]) -> dict:
+                async with upsert_semaphore:
+                    if page_id:
+                        return await self.notion.update_page(page_id, properties)
+                    return await self.notion.create_page(calendar_db['id'], properties)
+
+            upserts = []  # (properties, existing page ID) of each row; coroutines are only created once all are built
+            entries = []  # (show, season, episode, air date) of each upsert, for error logging
             for cal in cals:
                 series_id = cal.get('seriesId', 0)
-                show = self.sonarr.cache.get_show(series_id)
+                show = all_series.get(series_id)
                 if not show:
-                    self.logger.warning(f"Could not find series {series_id} in cache for calendar entry")
+                    self.logger.warning("Could not find series %s for calendar entry", series_id)
                     continue
 
                 show_title = show.get('title', 'Unknown Show')
@@ -74,55 +94,79 @@ class ScheduledTasks:
                     })
                 }
 
-                # Filter by Episode ID and Date to find existing entry
-                filter_params = {
-                    "and": [
-                        {
-                            "property": "Episode ID",
-                            "number": {
-                                "equals": episode_id
-                            }
-                        },
-                        {
-                            "property": "Air Date",
-                            "date": {
-                                "equals": air_date
-                            }
-                        }
-                    ]
-                }
-
-                self.logger.info(f"Creating/Updating calendar entry for {show_title} - S{season_number}E{episode_number} on {air_date}")
-                await self.notion.create_or_update_row(
-                    database_id=calendar_db['id'],
-                    properties=properties,
-                    filter_params=filter_params
-                )
-            self.logger.info("Database updates completed successfully")
+                self.logger.info("Creating/Updating calendar entry for %s - S%sE%s on %s", show_title, season_number, episode_number, air_date)
+                upserts.append((properties, existing_rows.get((episode_id, air_date))))
+                entries.append((show_title, season_number, episode_number, air_date))
+
+            # Let every row finish and report failures per row rather than aborting the sync
+            results = await asyncio.gather(
+                *(upsert_entry(properties, page_id) for properties, page_id in upserts),
+                return_exceptions=True
+            )
+            failed_count = 0
+            for entry, result in zip(entries, results):
+                if isinstance(result, Exception):
+                    failed_count += 1
+                    self.logger.error("Error creating/updating calendar entry for %s - S%sE%s on %s: %s", *entry, result)
+            if failed_count:
+                self.logger.warning("Database updates completed with %s of %s calendar entries failed", failed_count, len(results))
+            else:
+                self.logger.info("Database updates completed successfully")
+        except Exception as e:
+            self.logger.error("Error in scheduled database updates: %s", e)
+
+    async def index_calendar_rows(self, database_id: str) -> Dict[Tuple[int, str], str]:
+        """Map (Episode ID, Air Date) to page ID for every row in the calendar database"""
+        rows = {}
+        async for page in self.notion.iter_database(database_id):
+            properties = page.get('properties', {})
+            episode_id = properties.get('Episode ID', {}).get('number')
+            air_date = (properties.get('Air Date', {}).get('date') or {}).get('start')
+            if episode_id is not None and air_date:
+                # Keep the first row for a key, as the per-row filter query did
+                rows.setdefault((int(episode_id), air_date), page['id'])
+        return rows
+
+    async def warm_up(self) -> None:
+        """Initialize the Sonarr cache and run the first database update - runs once at startup"""
+        try:
+            self.logger.info("Initializing Sonarr cache...")
+            await self.sonarr.initialize_cache()
         except Exception as e:
-            self.logger.error(f"Error in scheduled database updates: {str(e)}")
+            self.logger.error("Error initializing Sonarr cache: %s", e)
+
+        await self.update_databases()
+
+    async def cancel_warm_up(self) -> None:
+        """Cancel the startup warm-up if it is still running and wait for it to unwind"""
+        task = self.warm_up_task
+        if task is None or task.done():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
 
     async def update_youtube_stats(self) -> None:
         """Update YouTube channel stats in Notion database"""
         try:
             self.logger.info("Starting YouTube channel stats update")
             
-            # Initialize YouTube API client
-            async with YouTubeAPI(log_level=self.logger.level) as youtube:
-                # Get channel stats for @ameasureofpassion
-                channel_id = await youtube.get_channel_id('@ameasureofpassion')
-                stats = await youtube.get_channel_stats(channel_id)
-                
-                # Update Notion database
-                await self.notion.update_youtube_channel_stats(stats)
-                
+            # Get channel stats for @ameasureofpassion using the long-lived client and its pooled session
+            channel_id = await self.youtube.get_channel_id('@ameasureofpassion')
+            stats = await self.youtube.get_channel_stats(channel_id)
+            
+            # Update Notion database
+            await self.notion.update_youtube_channel_stats(stats)
+            
             self.logger.info("YouTube channel stats update completed successfully")
         except Exception as e:
-            self.logger.error(f"Error updating YouTube stats: {str(e)}")
+            self.logger.error("Error updating YouTube stats: %s", e)
 
     async def update_youtube_channels(self):
         """Update YouTube channel database - runs at startup and daily"""
-        self.logger.info(f"Running scheduled YouTube channel updates at {datetime.now()}")
+        self.logger.info("Running scheduled YouTube channel updates at %s", datetime.now())
 
         try:
             # Get database ID
@@ -136,12 +180,12 @@ class ScheduledTasks:
                 try:
                     channel_id = channel['properties'].get('Channel ID', {}).get('rich_text', [{}])[0].get('text', {}).get('content', '')
                     if not channel_id:
-                        self.logger.warning(f"No channel ID found for row {channel['id']}")
+                        self.logger.warning("No channel ID found for row %s", channel['id'])
                         continue
                         
                     channel_info = await self.youtube.get_channel_info(channel_id)
                     if not channel_info:
-                        self.logger.warning(f"Could not get info for channel {channel_id}")
+                        self.logger.warning("Could not get info for channel %s", channel_id)
                         continue
                         
                     properties = {
@@ -154,27 +198,23 @@ class ScheduledTasks:
                         "Last Updated": self.notion.format_property(NotionPropertyType.DATE, datetime.now().isoformat()),
                     }
                     
-                    self.logger.info(f"Updating channel {channel_info['title']}")
+                    self.logger.info("Updating channel %s", channel_info['title'])
                     await self.notion.update_page(page_id=channel['id'], properties=properties)
                     
                 except Exception as e:
-                    self.logger.error(f"Error updating channel {channel.get('id', 'Unknown')}: {str(e)}")
+                    self.logger.error("Error updating channel %s: %s", channel.get('id', 'Unknown'), e)
                     continue
                     
             self.logger.info("YouTube channel updates completed successfully")
         except Exception as e:
-            self.logger.error(f"Error in scheduled YouTube channel updates: {str(e)}")
+            self.logger.error("Error in scheduled YouTube channel updates: %s", e)
 
     @staticmethod
-    async def initialize_scheduler(notion_client: NotionDB, sonarr_client: Sonarr, youtube_client: YouTubeAPI, logger: logging.Logger) -> AsyncIOScheduler:
-        """Initialize and start the APScheduler"""
+    async def initialize_scheduler(notion_client: NotionDB, sonarr_client: Sonarr, youtube_client: YouTubeAPI, logger: logging.Logger) -> Tuple[AsyncIOScheduler, "ScheduledTasks"]:
+        """Initialize and start the APScheduler, returning it with the tasks instance it runs"""
         scheduler = AsyncIOScheduler()
         tasks = ScheduledTasks(notion_client, sonarr_client, youtube_client, logger)
         
-        # Initialize Sonarr cache
-        logger.info("Initializing Sonarr cache...")
-        await sonarr_client.initialize_cache()
-        
         # Add job to run at midnight every day
         scheduler.add_job(
             tasks.update_databases,
@@ -206,16 +246,10 @@ class ScheduledTasks:
         scheduler.start()
         logger.info("Scheduler started")
         
-        # Run initial updates
-        asyncio.create_task(tasks.update_databases())
+        # Run initial cache warm-up and updates without blocking startup; keep a reference
+        # so the task isn't garbage collected before it finishes
+        tasks.warm_up_task = asyncio.create_task(tasks.warm_up())
         # asyncio.create_task(tasks.update_youtube_stats())
         # asyncio.create_task(tasks.update_youtube_channels())
         
-        return scheduler
-
-    @staticmethod
-    def register_startup_handler(app: FastAPI, notion_client: NotionDB, sonarr_client: Sonarr, youtube_client: YouTubeAPI, logger: logging.Logger):
-        """Register the startup event handler with FastAPI"""
-        @app.on_event("startup")
-        async def startup_event():
-            await ScheduledTasks.initialize_scheduler(notion_client, sonarr_client, youtube_client, logger)
+        return scheduler, tasks
@@ -0,0 +1,53 @@
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+from dotenv import load_dotenv
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application configuration, read from the environment once at startup"""
+    sonarr_api_key: Optional[str]
+    sonarr_url: Optional[str]
+    notion_token: Optional[str]
+    youtube_api_key: Optional[str]
+    webhook_api_key: Optional[str]
+    log_level: int
+    sonarr_past_days: int
+    sonarr_future_days: int
+    web_concurrency: int
+    notion_page_telly: Optional[str]
+    notion_page_youtube: Optional[str]
+    notion_db_tv_calendar: Optional[str]
+    notion_db_yt_channel: Optional[str]
+    notion_cache_file: Optional[str]
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """Build settings from environment variables"""
+        return cls(
+            sonarr_api_key=os.getenv('SONARR_API_KEY'),
+            sonarr_url=os.getenv('SONARR_URL'),
+            notion_token=os.getenv('NOTION_TOKEN'),
+            youtube_api_key=os.getenv('YOUTUBE_API_KEY'),
+            webhook_api_key=os.getenv('WEBHOOK_API_KEY'),
+            log_level=getattr(logging, os.getenv('LOG_LEVEL', 'INFO').upper(), logging.INFO),
+            sonarr_past_days=int(os.getenv('SONARR_PAST_DAYS', '7')),
+            sonarr_future_days=int(os.getenv('SONARR_FUTURE_DAYS', '14')),
+            web_concurrency=int(os.getenv('WEB_CONCURRENCY', '1')),
+            notion_page_telly=os.getenv('NOTION_PAGE_TELLY'),
+            notion_page_youtube=os.getenv('NOTION_PAGE_YOUTUBE'),
+            notion_db_tv_calendar=os.getenv('NOTION_DB_TV_CALENDAR'),
+            notion_db_yt_channel=os.getenv('NOTION_DB_YT_CHANNEL'),
+            # Opt-in on-disk cache of Notion child database listings; unset or empty disables it
+            notion_cache_file=os.getenv('NOTION_CACHE_FILE') or None
+        )
+
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Load .env and return the process-wide settings"""
+    load_dotenv()
+    return Settings.from_env()
@@ -5,6 +5,7 @@ from datetime import datetime, timedelta
 import aiohttp
 from dotenv import load_dotenv
 from urllib.parse import urljoin
+from log_formatter import LOG_FORMATTER
 from sonarr_cache import SonarrCache
 
 class SonarrError(Exception):
@@ -12,7 +13,7 @@ class SonarrError(Exception):
     pass
 
 class Sonarr:
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, log_level: int = logging.INFO, logger: Optional[logging.Logger] = None):
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, log_level: int = logging.INFO, logger: Optional[logging.Logger] = None, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize Sonarr client
         
@@ -21,6 +22,7 @@ class Sonarr:
             base_url (Optional[str]): Sonarr base URL (default: from env SONARR_URL)
             log_level (int): Logging level (default: logging.INFO)
             logger (Optional[logging.Logger]): Custom logger instance
+            session (Optional[aiohttp.ClientSession]): Shared HTTP session (default: create one on first request)
         """
         # Setup logging
         if logger:
@@ -30,8 +32,7 @@ class Sonarr:
             if not self.logger.handlers:
                 handler = logging.StreamHandler()
                 handler.setLevel(log_level)
-                formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-                handler.setFormatter(formatter)
+                handler.setFormatter(LOG_FORMATTER)
                 self.logger.addHandler(handler)
         
         self.logger.setLevel(log_level)
@@ -48,37 +49,47 @@ class Sonarr:
             self.logger.error(error_msg)
             raise ValueError(error_msg)
             
+        # Resolve the API root once instead of joining URLs on every request
+        self.api_url = urljoin(self.base_url, '/api/v3/')
+        self.headers = {
+            'X-Api-Key': self.api_key,
+            'Accept': 'application/json'
+        }
+            
         # Initialize cache and session
         self.cache = SonarrCache(logger=self.logger)
-        self.session = None
+        self.session = session
+        self._owns_session = session is None
         
         self.logger.info("Sonarr client initialized successfully")
         
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(headers={
-            'X-Api-Key': self.api_key,
-            'Accept': 'application/json'
-        })
+        if not self.session:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
             
+    def use_session(self, session: aiohttp.ClientSession) -> None:
+        """Use a shared aiohttp session owned (and closed) by the caller"""
+        self.session = session
+        self._owns_session = False
+
     async def _make_request(self, endpoint: str, method: str = 'GET', params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make an async request to the Sonarr API"""
         if not self.session:
-            self.session = aiohttp.ClientSession(headers={
-                'X-Api-Key': self.api_key,
-                'Accept': 'application/json'
-            })
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
             
-        url = urljoin(self.base_url, f'/api/v3/{endpoint}')
+        url = f'{self.api_url}{endpoint}'
         
         try:
-            async with self.session.request(method, url, params=params) as response:
+            async with self.session.request(method, url, params=params, headers=self.headers) as response:
                 response.raise_for_status()
                 return await response.json()
         except aiohttp.ClientError as e:
@@ -116,20 +127,20 @@ class Sonarr:
                 return cached_show
         
         # Still not found - fetch individual show
-        self.logger.debug(f"Cache miss for series {series_id}, fetching from API")
+        self.logger.debug("Cache miss for series %s, fetching from API", series_id)
         try:
             show = await self._make_request(f'series/{series_id}')
             self.cache.update_show(show)
             return show
         except SonarrError as e:
             if "404" in str(e):  # Show not found
-                self.logger.warning(f"Series {series_id} not found in Sonarr")
+                self.logger.warning("Series %s not found in Sonarr", series_id)
                 return None
             raise
 
     async def get_episodes_by_series_id(self, series_id: int) -> List[Dict[str, Any]]:
         """Get all episodes for a specific series"""
-        self.logger.debug(f"Fetching episodes for series ID: {series_id}")
+        self.logger.debug("Fetching episodes for series ID: %s", series_id)
         return await self._make_request(f'episode?seriesId={series_id}')
 
     async def get_season_by_series_id(self, series_id: int, season_number: int) -> List[Dict[str, Any]]:
@@ -138,7 +149,7 @@ class Sonarr:
         if cached_season:
             return cached_season['episodes']
             
-        self.logger.debug(f"Cache miss for season {season_number} of series {series_id}, fetching from API")
+        self.logger.debug("Cache miss for season %s of series %s, fetching from API", season_number, series_id)
         episodes = await self.get_episodes_by_series_id(series_id)
         season_episodes = [ep for ep in episodes if ep.get('seasonNumber') == season_number]
         
@@ -167,7 +178,7 @@ class Sonarr:
         if end_date:
             params['end'] = end_date.strftime('%Y-%m-%d')
             
-        self.logger.debug(f"Fetching calendar from {start_date} to {end_date}")
+        self.logger.debug("Fetching calendar from %s to %s", start_date, end_date)
         return await self._make_request('calendar', params=params)
 
     async def get_episodes_calendar(self, past_days: int = 7, future_days: int = 7) -> List[Dict[str, Any]]:
@@ -176,7 +187,7 @@ class Sonarr:
         start_date = current_date - timedelta(days=past_days)
         end_date = current_date + timedelta(days=future_days)
         
-        self.logger.debug(f"Fetching episodes from {past_days} days ago to {future_days} days ahead")
+        self.logger.debug("Fetching episodes from %s days ago to %s days ahead", past_days, future_days)
         return await self.get_calendar(start_date, end_date)
 
     async def handle_webhook(self, event_data: dict) -> None:
@@ -187,8 +198,8 @@ class Sonarr:
                 self.logger.error("Received webhook with no eventType")
                 return
             
-            self.logger.info(f"Received Sonarr webhook event: {event_type}")
-            self.logger.debug(f"Event data: {event_data}")
+            self.logger.info("Received Sonarr webhook event: %s", event_type)
+            self.logger.debug("Event data: %s", event_data)
             
             # Handle different event types
             if event_type == "Download":
@@ -198,9 +209,9 @@ class Sonarr:
             elif event_type == "Rename":
                 await self._handle_rename_event(event_data)
             else:
-                self.logger.warning(f"Unhandled event type: {event_type}")
+                self.logger.warning("Unhandled event type: %s", event_type)
         except Exception as e:
-            self.logger.error(f"Error handling webhook: {str(e)}")
+            self.logger.error("Error handling webhook: %s", e)
             raise
 
     async def _handle_download_event(self, event_data: dict) -> None:
@@ -219,9 +230,9 @@ class Sonarr:
                 if season_num is not None and ep_num is not None:
                     self.cache.update_episode(series_id, season_num, ep_num, episode)
                     
-            self.logger.info(f"Download completed: {series.get('title')} - S{episode.get('seasonNumber', 0)}E{episode.get('episodeNumber', 0)}")
+            self.logger.info("Download completed: %s - S%sE%s", series.get('title'), episode.get('seasonNumber', 0), episode.get('episodeNumber', 0))
         except Exception as e:
-            self.logger.error(f"Error handling download event: {str(e)}")
+            self.logger.error("Error handling download event: %s", e)
             raise
 
     async def _handle_grab_event(self, event_data: dict) -> None:
@@ -229,23 +240,23 @@ class Sonarr:
         try:
             series = event_data.get('series', {})
             episode = event_data.get('episodes', [{}])[0]
-            self.logger.info(f"Episode grabbed: {series.get('title')} - S{episode.get('seasonNumber', 0)}E{episode.get('episodeNumber', 0)}")
+            self.logger.info("Episode grabbed: %s - S%sE%s", series.get('title'), episode.get('seasonNumber', 0), episode.get('episodeNumber', 0))
         except Exception as e:
-            self.logger.error(f"Error handling grab event: {str(e)}")
+            self.logger.error("Error handling grab event: %s", e)
             raise
 
     async def _handle_rename_event(self, event_data: dict) -> None:
         """Handle rename events"""
         try:
             series = event_data.get('series', {})
-            self.logger.info(f"Series renamed: {series.get('title')}")
+            self.logger.info("Series renamed: %s", series.get('title'))
             
             # Update cache with renamed series
             series_id = series.get('id')
             if series_id:
                 self.cache.update_show(series)
         except Exception as e:
-            self.logger.error(f"Error handling rename event: {str(e)}")
+            self.logger.error("Error handling rename event: %s", e)
             raise
 
     async def initialize_cache(self) -> None:
@@ -294,5 +305,5 @@ class Sonarr:
             
             self.logger.info("Cache initialized successfully")
         except Exception as e:
-            self.logger.error(f"Error initializing cache: {str(e)}")
+            self.logger.error("Error initializing cache: %s", e)
             raise
@@ -26,19 +26,19 @@ class SonarrCache:
             return
             
         self.shows[series_id] = show_data
-        self.logger.debug(f"Updated show cache for series {series_id}")
+        self.logger.debug("Updated show cache for series %s", series_id)
         
     def update_season(self, series_id: int, season_number: int, season_data: Dict[str, Any]) -> None:
         """Update a single season in the cache"""
         cache_key = f"{series_id}_{season_number}"
         self.seasons[cache_key] = season_data
-        self.logger.debug(f"Updated season cache for {cache_key}")
+        self.logger.debug("Updated season cache for %s", cache_key)
         
     def update_episode(self, series_id: int, season_number: int, episode_number: int, episode_data: Dict[str, Any]) -> None:
         """Update a single episode in the cache"""
         cache_key = f"{series_id}_{season_number}_{episode_number}"
         self.episodes[cache_key] = episode_data
-        self.logger.debug(f"Updated episode cache for {cache_key}")
+        self.logger.debug("Updated episode cache for %s", cache_key)
         
     def get_show(self, series_id: int) -> Optional[Dict[str, Any]]:
         """Get show data from cache"""
@@ -58,17 +58,17 @@ class SonarrCache:
         """Update multiple shows at once"""
         self.shows.update(shows_data)
         self.last_full_update = datetime.now()
-        self.logger.info(f"Updated {len(shows_data)} shows in cache")
+        self.logger.info("Updated %s shows in cache", len(shows_data))
         
     def bulk_update_seasons(self, seasons_data: Dict[str, Dict[str, Any]]) -> None:
         """Update multiple seasons at once"""
         self.seasons.update(seasons_data)
-        self.logger.info(f"Updated {len(seasons_data)} seasons in cache")
+        self.logger.info("Updated %s seasons in cache", len(seasons_data))
         
     def bulk_update_episodes(self, episodes_data: Dict[str, Dict[str, Any]]) -> None:
         """Update multiple episodes at once"""
         self.episodes.update(episodes_data)
-        self.logger.info(f"Updated {len(episodes_data)} episodes in cache")
+        self.logger.info("Updated %s episodes in cache", len(episodes_data))
         
     def clear(self) -> None:
         """Clear all cache data"""
@@ -0,0 +1,18 @@
+import unittest
+from fastapi.testclient import TestClient
+from api import initialize_api, settings
+
+
+class WebhookTests(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(initialize_api(sonarr_client=None))
+        self.headers = {"X-API-Key": settings.webhook_api_key} if settings.webhook_api_key else {}
+
+    def test_non_json_body_is_rejected(self):
+        response = self.client.post("/webhook", content=b"not json", headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"detail": "Invalid JSON body"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,22 @@
+import logging
+import unittest
+from unittest.mock import AsyncMock
+from notion_db import NotionDB
+
+
+class AppendBlockChildrenTests(unittest.IsolatedAsyncioTestCase):
+    async def test_more_than_one_batch_is_split_in_order(self):
+        db = NotionDB(token="test", logger=logging.getLogger("test"))
+        blocks = [{"id": str(i)} for i in range(NotionDB.MAX_BLOCK_CHILDREN + 50)]
+        db._make_request = AsyncMock(side_effect=lambda method, endpoint, data, **kwargs: {"results": data["children"]})
+
+        appended = await db.append_block_children("page", blocks)
+
+        self.assertEqual(appended, blocks)
+        self.assertEqual(db._make_request.await_count, 2)
+        sent = [call.args[2]["children"] for call in db._make_request.await_args_list]
+        self.assertEqual(sent, [blocks[:NotionDB.MAX_BLOCK_CHILDREN], blocks[NotionDB.MAX_BLOCK_CHILDREN:]])
+
+
+if __name__ == "__main__":
+    unittest.main()
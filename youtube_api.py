@@ -4,6 +4,7 @@ from typing import Optional, Dict, Any, List
 import os
 import aiohttp
 from urllib.parse import urlparse, parse_qs
+from log_formatter import LOG_FORMATTER
 
 class YouTubeAPIError(Exception):
     """Base exception for YouTube API errors"""
@@ -12,7 +13,7 @@ class YouTubeAPIError(Exception):
 class YouTubeAPI:
     BASE_URL = "https://www.googleapis.com/youtube/v3"
     
-    def __init__(self, api_key: Optional[str] = None, log_level: int = logging.INFO, logger: Optional[logging.Logger] = None):
+    def __init__(self, api_key: Optional[str] = None, log_level: int = logging.INFO, logger: Optional[logging.Logger] = None, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize YouTube API client
         
@@ -20,6 +21,7 @@ class YouTubeAPI:
             api_key (Optional[str]): YouTube Data API key (default: from env YOUTUBE_API_KEY)
             log_level (int): Logging level (default: logging.INFO)
             logger (Optional[logging.Logger]): Custom logger instance
+            session (Optional[aiohttp.ClientSession]): Shared HTTP session (default: create one on first request)
         """
         if logger:
             self.logger = logger
@@ -28,8 +30,7 @@ class YouTubeAPI:
             if not self.logger.handlers:
                 handler = logging.StreamHandler()
                 handler.setLevel(log_level)
-                formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-                handler.setFormatter(formatter)
+                handler.setFormatter(LOG_FORMATTER)
                 self.logger.addHandler(handler)
         
         self.logger.setLevel(log_level)
@@ -40,21 +41,30 @@ class YouTubeAPI:
             self.logger.error(error_msg)
             raise ValueError(error_msg)
             
-        self.session = None
+        self.session = session
+        self._owns_session = session is None
         self.logger.info("YouTube API client initialized successfully")
 
     async def __aenter__(self):
-        self.session = aiohttp.ClientSession()
+        if not self.session:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
+        if self.session and self._owns_session:
             await self.session.close()
 
+    def use_session(self, session: aiohttp.ClientSession) -> None:
+        """Use a shared aiohttp session owned (and closed) by the caller"""
+        self.session = session
+        self._owns_session = False
+
     async def _make_request(self, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Make an HTTP request to the YouTube Data API"""
         if not self.session:
             self.session = aiohttp.ClientSession()
+            self._owns_session = True
 
         params['key'] = self.api_key
         url = f"{self.BASE_URL}/{endpoint}"